@@ -103,6 +103,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
     ],
+    'EXCEPTION_HANDLER': 'tasks.exceptions.exception_handler',
 }
 
 # CORS settings - Allow frontend to communicate with backend
@@ -0,0 +1,36 @@
+"""
+Exception handling for the Smart Task Analyzer API.
+
+DRF's own exceptions (parse errors, 404s, ...) keep their status codes;
+anything else is turned into the JSON 500 the views used to build
+themselves. Either way the message is under 'error', which is where the
+frontend looks for it.
+"""
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler as drf_exception_handler, set_rollback
+
+
+def exception_handler(exc, context):
+    """
+    Convert unhandled view exceptions into JSON error responses.
+    
+    Args:
+        exc: The exception raised by the view
+        context: DRF handler context (view, request, args, kwargs)
+    
+    Returns:
+        Response with the error payload
+    """
+    response = drf_exception_handler(exc, context)
+    if response is not None:
+        if isinstance(response.data, dict) and 'detail' in response.data:
+            response.data = {'error': response.data['detail']}
+        return response
+    
+    set_rollback()
+    return Response(
+        {'error': f'Internal error: {exc}'},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR
+    )
@@ -41,20 +41,33 @@ STRATEGIES:
 - deadline_driven: Prioritizes urgency/due dates
 """
 
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Tuple, Optional, Any, Set
+from bisect import bisect_left
+from collections import Counter, deque
+from datetime import date
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Deque, Dict, List, Tuple, Optional, Any, Set
+import heapq
 import math
+import re
 
 
 # Common US holidays (month, day) - extensible
-HOLIDAYS = {
+HOLIDAYS = frozenset({
     (1, 1),    # New Year's Day
     (7, 4),    # Independence Day
     (12, 25),  # Christmas
     (12, 31),  # New Year's Eve
     (11, 28),  # Thanksgiving (approximate)
     (11, 29),  # Day after Thanksgiving
-}
+})
+
+FEEDBACK_HISTORY_SIZE = 1000  # Most recent feedback events kept in memory
+MAX_WEIGHT_ADJUSTMENT = 0.15  # Learned adjustments stay within ±15%
+
+_WEIGHT_KEYS = ('urgency', 'importance', 'effort', 'dependency')
+_EMPTY_SCORES: Dict[str, float] = {}  # Shared default; never mutated
 
 
 # ============================================
@@ -73,21 +86,26 @@ class LearningSystem:
     to gradually shift weights based on feedback patterns.
     """
     
-    def __init__(self):
-        # Feedback history: list of (task_features, was_helpful)
-        self.feedback_history: List[Dict] = []
+    def __init__(self, track_history: bool = True):
+        """
+        Args:
+            track_history: Keep recent feedback records in feedback_history.
+                Learning only needs the counters and adjustments, so
+                services that never read the history can turn this off.
+        """
+        self.track_history = track_history
+        # Feedback history: most recent (task_features, was_helpful) records.
+        # Only the current event drives learning, so older entries are dropped
+        self.feedback_history: Deque[Dict] = deque(maxlen=FEEDBACK_HISTORY_SIZE)
         # Learned weight adjustments (starts at 0 = no adjustment)
-        self.weight_adjustments = {
-            'urgency': 0.0,
-            'importance': 0.0,
-            'effort': 0.0,
-            'dependency': 0.0,
-        }
+        self.weight_adjustments = {key: 0.0 for key in _WEIGHT_KEYS}
         # Learning rate (how quickly to adjust)
         self.learning_rate = 0.05
         # Feedback count for statistics
         self.helpful_count = 0
         self.not_helpful_count = 0
+        # Last (inputs, result) of get_adjusted_weights
+        self._last_adjusted: Optional[Tuple[Tuple, Dict[str, float]]] = None
     
     def record_feedback(self, task_data: Dict, was_helpful: bool) -> Dict:
         """
@@ -101,17 +119,22 @@ class LearningSystem:
             Updated statistics
         """
         # Extract relevant features
-        feedback = {
-            'was_helpful': was_helpful,
-            'urgency_score': task_data.get('_scores', {}).get('urgency', 50),
-            'importance_score': task_data.get('_scores', {}).get('importance', 50),
-            'effort_score': task_data.get('_scores', {}).get('effort', 50),
-            'dependency_score': task_data.get('_scores', {}).get('dependency', 0),
-            'priority_score': task_data.get('priority_score', 50),
-            'is_overdue': task_data.get('is_overdue', False),
-        }
+        scores = task_data.get('_scores') or _EMPTY_SCORES
+        urgency = scores.get('urgency', 50)
+        importance = scores.get('importance', 50)
+        effort = scores.get('effort', 50)
+        dependency = scores.get('dependency', 0)
         
-        self.feedback_history.append(feedback)
+        if self.track_history:
+            self.feedback_history.append({
+                'was_helpful': was_helpful,
+                'urgency_score': urgency,
+                'importance_score': importance,
+                'effort_score': effort,
+                'dependency_score': dependency,
+                'priority_score': task_data.get('priority_score', 50),
+                'is_overdue': task_data.get('is_overdue', False),
+            })
         
         if was_helpful:
             self.helpful_count += 1
@@ -119,33 +142,30 @@ class LearningSystem:
             self.not_helpful_count += 1
         
         # Update weight adjustments based on feedback
-        self._update_weights(feedback)
+        self._update_weights(was_helpful, urgency, importance, effort, dependency)
         
         return self.get_statistics()
     
-    def _update_weights(self, feedback: Dict) -> None:
-        """Update weight adjustments based on feedback."""
-        was_helpful = feedback['was_helpful']
-        
+    def _update_weights(
+        self,
+        was_helpful: bool,
+        urgency: float,
+        importance: float,
+        effort: float,
+        dependency: float
+    ) -> None:
+        """Update weight adjustments based on one feedback event's factor scores."""
         # If helpful, slightly increase weights for high-scoring factors
         # If not helpful, slightly decrease them
         adjustment = self.learning_rate if was_helpful else -self.learning_rate
         
-        # Normalize scores to -1 to 1 range for adjustment
-        urgency_factor = (feedback['urgency_score'] - 50) / 50
-        importance_factor = (feedback['importance_score'] - 50) / 50
-        effort_factor = (feedback['effort_score'] - 50) / 50
-        dependency_factor = (feedback['dependency_score'] - 50) / 50
-        
-        # Apply adjustments (capped at ±0.15 to prevent wild swings)
-        self.weight_adjustments['urgency'] = max(-0.15, min(0.15,
-            self.weight_adjustments['urgency'] + adjustment * urgency_factor))
-        self.weight_adjustments['importance'] = max(-0.15, min(0.15,
-            self.weight_adjustments['importance'] + adjustment * importance_factor))
-        self.weight_adjustments['effort'] = max(-0.15, min(0.15,
-            self.weight_adjustments['effort'] + adjustment * effort_factor))
-        self.weight_adjustments['dependency'] = max(-0.15, min(0.15,
-            self.weight_adjustments['dependency'] + adjustment * dependency_factor))
+        # Normalize each score to -1 to 1 range and apply the adjustment,
+        # capped at ±0.15 to prevent wild swings
+        adjustments = self.weight_adjustments
+        for key, score in zip(_WEIGHT_KEYS, (urgency, importance, effort, dependency)):
+            factor = (score - 50) / 50
+            adjustments[key] = max(-MAX_WEIGHT_ADJUSTMENT, min(MAX_WEIGHT_ADJUSTMENT,
+                adjustments[key] + adjustment * factor))
     
     def get_adjusted_weights(self, base_weights: Dict[str, float]) -> Dict[str, float]:
         """
@@ -157,6 +177,12 @@ class LearningSystem:
         Returns:
             Adjusted weights incorporating learned preferences
         """
+        # Scoring asks for the same weights repeatedly between feedback
+        # events, so the last result is reused while nothing has changed
+        cache_key = (tuple(base_weights.items()), tuple(self.weight_adjustments.values()))
+        if self._last_adjusted is not None and self._last_adjusted[0] == cache_key:
+            return self._last_adjusted[1].copy()
+        
         adjusted = {}
         for key, value in base_weights.items():
             adjustment = self.weight_adjustments.get(key, 0)
@@ -164,7 +190,9 @@ class LearningSystem:
         
         # Normalize to sum to 1
         total = sum(adjusted.values())
-        return {k: v / total for k, v in adjusted.items()}
+        result = {k: v / total for k, v in adjusted.items()}
+        self._last_adjusted = (cache_key, result)
+        return result.copy()
     
     def get_statistics(self) -> Dict:
         """Get learning system statistics."""
@@ -180,7 +208,7 @@ class LearningSystem:
     
     def reset(self) -> Dict:
         """Reset learning data."""
-        self.feedback_history = []
+        self.feedback_history.clear()
         self.weight_adjustments = {k: 0.0 for k in self.weight_adjustments}
         self.helpful_count = 0
         self.not_helpful_count = 0
@@ -191,17 +219,32 @@ class LearningSystem:
 learning_system = LearningSystem()
 
 
+# Lazily built per-year lookup: byte i is 1 if day-of-year i+1 is a working day
+_WORKDAY_BITMAPS: Dict[int, bytes] = {}
+
+
+def _get_bitmap(year: int) -> bytes:
+    """Return the working-day bitmap for a year, building it on first use."""
+    bitmap = _WORKDAY_BITMAPS.get(year)
+    if bitmap is None:
+        first = date(year, 1, 1).toordinal()
+        length = date(year, 12, 31).toordinal() - first + 1
+        flags = bytearray(length)
+        for offset in range(length):
+            d = date.fromordinal(first + offset)
+            # Weekend check (Saturday = 5, Sunday = 6) and holiday check
+            if d.weekday() < 5 and (d.month, d.day) not in HOLIDAYS:
+                flags[offset] = 1
+        bitmap = _WORKDAY_BITMAPS[year] = bytes(flags)
+    return bitmap
+
+
 def is_working_day(d: date) -> bool:
     """Check if a date is a working day (not weekend or holiday)."""
-    # Weekend check (Saturday = 5, Sunday = 6)
-    if d.weekday() >= 5:
-        return False
-    # Holiday check
-    if (d.month, d.day) in HOLIDAYS:
-        return False
-    return True
+    return _get_bitmap(d.year)[d.toordinal() - date(d.year, 1, 1).toordinal()] == 1
 
 
+@lru_cache(maxsize=4096)
 def count_working_days(start_date: date, end_date: date) -> int:
     """
     Count working days between two dates (excluding weekends and holidays).
@@ -210,13 +253,38 @@ def count_working_days(start_date: date, end_date: date) -> int:
     if end_date < start_date:
         return -count_working_days(end_date, start_date)
     
-    working_days = 0
-    current = start_date
-    while current <= end_date:
-        if is_working_day(current):
-            working_days += 1
-        current += timedelta(days=1)
-    return working_days
+    # Weekends in closed form: two per full week, plus any in the partial week
+    total_days = end_date.toordinal() - start_date.toordinal() + 1
+    full_weeks, extra_days = divmod(total_days, 7)
+    start_weekday = start_date.weekday()
+    weekend_days = full_weeks * 2 + sum(
+        1 for offset in range(extra_days) if (start_weekday + offset) % 7 >= 5
+    )
+    
+    # Holidays only matter when they fall on a weekday inside the range
+    holidays = 0
+    for year in range(start_date.year, end_date.year + 1):
+        for month, day in HOLIDAYS:
+            try:
+                holiday = date(year, month, day)
+            except ValueError:
+                continue  # e.g. Feb 29 outside a leap year
+            if start_date <= holiday <= end_date and holiday.weekday() < 5:
+                holidays += 1
+    
+    return total_days - weekend_days - holidays
+
+
+def clear_date_caches() -> None:
+    """
+    Clear the memoized working-day, urgency and task score results.
+    
+    Needed only if HOLIDAYS is replaced at runtime.
+    """
+    _WORKDAY_BITMAPS.clear()
+    count_working_days.cache_clear()
+    _urgency_for_dates.cache_clear()
+    _score_signature.cache_clear()
 
 
 # Default weight configuration
@@ -250,12 +318,70 @@ STRATEGY_WEIGHTS = {
     },
 }
 
+
+def _normalize_weights(weights: Dict[str, float]) -> Dict[str, float]:
+    """Scale a weight configuration so its values sum to 1."""
+    total_weight = sum(weights.values())
+    return {k: v / total_weight for k, v in weights.items()}
+
+
+# Built-in strategies never change, so normalize them once at import.
+# Treat these as read-only; they are shared by every scoring call.
+_NORMALIZED_STRATEGY_WEIGHTS = {
+    name: _normalize_weights(weights) for name, weights in STRATEGY_WEIGHTS.items()
+}
+
 # Scoring constants
 MAX_SCORE = 100
 OVERDUE_PENALTY = 20  # Additional penalty for overdue tasks
 DAYS_THRESHOLD_URGENT = 3  # Days until "urgent"
 DAYS_THRESHOLD_SOON = 7  # Days until "coming soon"
 MAX_EFFORT_HOURS = 40  # Cap for effort calculation
+URGENCY_LUT_DAYS = 366  # Urgency is tabulated for due dates up to a year out
+SCORE_CACHE_SIZE = 100_000  # Scored task signatures kept between calls
+
+# Fallback for due dates that are not zero-padded ISO 8601
+_LOOSE_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+# C-level sort key; avoids a Python lambda call per comparison key
+_PRIORITY_KEY = itemgetter('priority_score')
+
+# Eisenhower quadrant names indexed by (is_urgent << 1) | is_important
+_EISENHOWER_QUADRANTS = (
+    'eliminate',  # Quadrant 4: Not Urgent + Not Important
+    'schedule',   # Quadrant 2: Not Urgent + Important
+    'delegate',   # Quadrant 3: Urgent + Not Important
+    'do_first',   # Quadrant 1: Urgent + Important
+)
+
+
+# Urgency bands for tasks that are not overdue: inclusive upper day limit
+# of each band, and its linear formula as (base, slope, band start)
+_URGENCY_BAND_LIMITS = (0, DAYS_THRESHOLD_URGENT, DAYS_THRESHOLD_SOON, 14, 30)
+_URGENCY_BANDS = (
+    (MAX_SCORE, 0, 0),                   # Due today - maximum urgency
+    (MAX_SCORE, 5, 0),                   # Very urgent (1-3 working days)
+    (70, 5, DAYS_THRESHOLD_URGENT),      # Coming soon (4-7 working days)
+    (50, 3, DAYS_THRESHOLD_SOON),        # 1-2 weeks away
+    (30, 1, 14),                         # 2-4 weeks away
+)
+
+
+def _urgency_for_days(effective_days: int) -> float:
+    """Urgency for a task that is not overdue, by days until due."""
+    band = bisect_left(_URGENCY_BAND_LIMITS, effective_days)
+    if band == len(_URGENCY_BANDS):
+        # More than a month away - low urgency
+        # Minimum urgency of 5 to always have some consideration
+        return max(5, 15 - (effective_days - 30) * 0.1)
+    
+    base, slope, band_start = _URGENCY_BANDS[band]
+    return base - (effective_days - band_start) * slope
+
+
+# Urgency depends only on the (non-negative) day count, so the common range
+# is tabulated once and scoring is a single tuple index
+_URGENCY_LUT = tuple(_urgency_for_days(d) for d in range(URGENCY_LUT_DAYS))
 
 
 def calculate_urgency_score(due_date: date, today: Optional[date] = None, use_working_days: bool = True) -> Tuple[float, int, bool, int]:
@@ -285,7 +411,15 @@ def calculate_urgency_score(due_date: date, today: Optional[date] = None, use_wo
     if today is None:
         today = date.today()
     
-    days_until_due = (due_date - today).days
+    # Resolve today before the cache so a cached "today" never goes stale
+    return _urgency_for_dates(due_date, today, use_working_days)
+
+
+@lru_cache(maxsize=4096)
+def _urgency_for_dates(due_date: date, today: date, use_working_days: bool) -> Tuple[float, int, bool, int]:
+    """Memoized body of calculate_urgency_score; tasks often share due dates."""
+    # Ordinal subtraction avoids allocating a timedelta per task
+    days_until_due = due_date.toordinal() - today.toordinal()
     is_overdue = days_until_due < 0
     
     # Calculate working days for date intelligence
@@ -302,29 +436,50 @@ def calculate_urgency_score(due_date: date, today: Optional[date] = None, use_wo
         # Cap the overdue penalty to prevent extreme values
         overdue_bonus = min(days_overdue * 5, 50)
         urgency_score = MAX_SCORE + OVERDUE_PENALTY + overdue_bonus
-    elif effective_days == 0:
-        # Due today - maximum urgency
-        urgency_score = MAX_SCORE
-    elif effective_days <= DAYS_THRESHOLD_URGENT:
-        # Very urgent (1-3 working days) - exponential increase
-        urgency_score = MAX_SCORE - (effective_days * 5)
-    elif effective_days <= DAYS_THRESHOLD_SOON:
-        # Coming soon (4-7 working days) - moderate urgency
-        urgency_score = 70 - ((effective_days - DAYS_THRESHOLD_URGENT) * 5)
-    elif effective_days <= 14:
-        # 1-2 weeks away
-        urgency_score = 50 - ((effective_days - DAYS_THRESHOLD_SOON) * 3)
-    elif effective_days <= 30:
-        # 2-4 weeks away
-        urgency_score = 30 - ((effective_days - 14) * 1)
+    elif effective_days < URGENCY_LUT_DAYS:
+        urgency_score = _URGENCY_LUT[effective_days]
     else:
-        # More than a month away - low urgency
-        # Minimum urgency of 5 to always have some consideration
-        urgency_score = max(5, 15 - (effective_days - 30) * 0.1)
+        urgency_score = _urgency_for_days(effective_days)
     
     return (urgency_score, days_until_due, is_overdue, working_days)
 
 
+_LOG_MAX_EFFORT = math.log(MAX_EFFORT_HOURS + 1)
+
+
+def _importance_curve(importance: float) -> float:
+    """Curved 0-100 importance score for a rating (clamped to 1-10)."""
+    # Clamp importance to valid range
+    importance = max(1, min(10, importance))
+    
+    # Linear scaling with slight curve for higher values
+    # This makes the difference between 9 and 10 more significant
+    base_score = (importance / 10) * 100
+    
+    # Apply slight exponential curve
+    curved_score = base_score * (1 + (importance - 5) * 0.02)
+    
+    return min(MAX_SCORE, max(0, curved_score))
+
+
+def _effort_curve(estimated_hours: float) -> float:
+    """Inverse-log 0-100 effort score for an hour estimate (clamped)."""
+    # Clamp hours to valid range
+    hours = max(1, min(MAX_EFFORT_HOURS, estimated_hours))
+    
+    # Inverse logarithmic relationship
+    # 1 hour = ~100, 8 hours = ~50, 40 hours = ~10
+    effort_score = MAX_SCORE * (1 - (math.log(hours + 1) / _LOG_MAX_EFFORT))
+    
+    return max(10, min(MAX_SCORE, effort_score))
+
+
+# Both inputs are small clamped integers in practice, so the curves are
+# tabulated once; non-integer inputs still go through the formulas
+_IMPORTANCE_LUT = tuple(_importance_curve(i) for i in range(1, 11))
+_EFFORT_LUT = tuple(_effort_curve(h) for h in range(1, MAX_EFFORT_HOURS + 1))
+
+
 def calculate_importance_score(importance: int) -> float:
     """
     Convert importance rating (1-10) to 0-100 scale.
@@ -337,17 +492,9 @@ def calculate_importance_score(importance: int) -> float:
     Returns:
         Importance score on 0-100 scale
     """
-    # Clamp importance to valid range
-    importance = max(1, min(10, importance))
-    
-    # Linear scaling with slight curve for higher values
-    # This makes the difference between 9 and 10 more significant
-    base_score = (importance / 10) * 100
-    
-    # Apply slight exponential curve
-    curved_score = base_score * (1 + (importance - 5) * 0.02)
-    
-    return min(MAX_SCORE, max(0, curved_score))
+    if isinstance(importance, int):
+        return _IMPORTANCE_LUT[max(1, min(10, importance)) - 1]
+    return _importance_curve(importance)
 
 
 def calculate_effort_score(estimated_hours: int) -> float:
@@ -363,17 +510,36 @@ def calculate_effort_score(estimated_hours: int) -> float:
     Returns:
         Effort score on 0-100 scale (higher = easier/quicker)
     """
-    # Clamp hours to valid range
-    hours = max(1, min(MAX_EFFORT_HOURS, estimated_hours))
+    if isinstance(estimated_hours, int):
+        return _EFFORT_LUT[max(1, min(MAX_EFFORT_HOURS, estimated_hours)) - 1]
+    return _effort_curve(estimated_hours)
+
+
+def count_blocking_tasks(tasks: List[Dict]) -> Dict[str, int]:
+    """
+    Count how many tasks depend on each task ID.
     
-    # Inverse logarithmic relationship
-    # 1 hour = ~100, 8 hours = ~50, 40 hours = ~10
-    effort_score = MAX_SCORE * (1 - (math.log(hours + 1) / math.log(MAX_EFFORT_HOURS + 1)))
+    Built once per analysis so dependency scoring is a dictionary lookup
+    per task instead of a scan over every task's dependency list.
     
-    return max(10, min(MAX_SCORE, effort_score))
+    Args:
+        tasks: List of tasks with dependencies
+        
+    Returns:
+        Mapping of task ID to the number of tasks it blocks
+    """
+    # Counting a flattened iterable runs in C; the per-task set makes a
+    # dependency listed twice by the same task count once
+    return Counter(chain.from_iterable(
+        set(task.get('dependencies', [])) for task in tasks
+    ))
 
 
-def calculate_dependency_score(task_id: str, all_tasks: List[Dict]) -> Tuple[float, int]:
+def calculate_dependency_score(
+    task_id: str,
+    all_tasks: List[Dict],
+    blocking_counts: Optional[Dict[str, int]] = None
+) -> Tuple[float, int]:
     """
     Calculate dependency score based on how many other tasks this blocks.
     
@@ -383,73 +549,211 @@ def calculate_dependency_score(task_id: str, all_tasks: List[Dict]) -> Tuple[flo
     Args:
         task_id: The ID of the task to score
         all_tasks: List of all tasks to check dependencies
+        blocking_counts: Optional precomputed counts from count_blocking_tasks;
+            when given, all_tasks is not scanned
         
     Returns:
         Tuple of (dependency_score, blocking_count)
     """
-    blocking_count = 0
-    
-    for task in all_tasks:
-        dependencies = task.get('dependencies', [])
-        if task_id in dependencies:
-            blocking_count += 1
+    if blocking_counts is not None:
+        blocking_count = blocking_counts.get(task_id, 0)
+    else:
+        blocking_count = 0
+        for task in all_tasks:
+            dependencies = task.get('dependencies', [])
+            if task_id in dependencies:
+                blocking_count += 1
     
+    return (_dependency_points(blocking_count), blocking_count)
+
+
+def _dependency_points(blocking_count: int) -> int:
+    """Dependency score for a task that blocks blocking_count others."""
     # Score calculation: each blocked task adds points
     # Max out at 5 blocked tasks for scoring purposes
     effective_count = min(blocking_count, 5)
-    dependency_score = effective_count * 20  # 0, 20, 40, 60, 80, 100
-    
-    return (dependency_score, blocking_count)
+    return effective_count * 20  # 0, 20, 40, 60, 80, 100
 
 
 def detect_circular_dependencies(tasks: List[Dict]) -> List[List[str]]:
     """
     Detect circular dependencies in the task list.
     
-    Uses depth-first search to find cycles in the dependency graph.
+    Uses an iterative form of Tarjan's strongly connected components
+    algorithm: O(V + E) overall, with an explicit stack so long dependency
+    chains cannot hit Python's recursion limit. Every component with more
+    than one task (or a task that depends on itself) is reported once.
+    
+    Args:
+        tasks: List of tasks with dependencies
+        
+    Returns:
+        List of cycles found, one per component (each cycle is a list of
+        task IDs following real dependency edges, ending with the ID it
+        started from)
+    """
+    ids, graph = _encode_dependency_graph(tasks)
+    return _find_cycles(ids, graph)
+
+
+def _encode_dependency_graph(
+    tasks: List[Dict],
+    known_ids: Optional[Set[str]] = None
+) -> Tuple[List[str], List[List[int]]]:
+    """
+    Map task IDs to dense integers and build an integer adjacency list.
+    
+    Graph traversals then index plain lists instead of hashing strings.
+    Each task points at the tasks it depends on; if an ID repeats, the
+    last task with that ID wins.
     
     Args:
         tasks: List of tasks with dependencies
+        known_ids: The result of _known_task_ids(tasks), if already built
         
     Returns:
-        List of cycles found (each cycle is a list of task IDs)
+        Tuple of (ids, graph) where ids[n] is the task ID of node n and
+        graph[n] lists the nodes that node n depends on
     """
-    # Build adjacency list
-    task_ids = {task.get('id', str(i)): task for i, task in enumerate(tasks)}
-    graph = {}
+    if known_ids is None:
+        known_ids = _known_task_ids(tasks)
     
+    ids: List[str] = []
+    index_of: Dict[str, int] = {}
     for task in tasks:
         task_id = task.get('id', '')
-        dependencies = task.get('dependencies', [])
-        graph[task_id] = [dep for dep in dependencies if dep in task_ids]
+        if task_id not in index_of:
+            index_of[task_id] = len(ids)
+            ids.append(task_id)
     
-    cycles = []
-    visited = set()
-    rec_stack = set()
+    graph: List[List[int]] = [[] for _ in ids]
+    for task in tasks:
+        graph[index_of[task.get('id', '')]] = [
+            index_of[dep] for dep in task.get('dependencies') or ()
+            if dep in known_ids and dep in index_of
+        ]
     
-    def dfs(node: str, path: List[str]) -> None:
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
+    return ids, graph
+
+
+def _known_task_ids(tasks: List[Dict]) -> Set[str]:
+    """IDs a dependency may refer to (tasks without an ID go by position)."""
+    return {task.get('id', str(i)) for i, task in enumerate(tasks)}
+
+
+def _cyclic_components(graph: List[List[int]]) -> List[List[int]]:
+    """
+    Iterative Tarjan SCC over an encoded graph; see detect_circular_dependencies.
+    
+    Returns:
+        Components that contain a cycle, in the order their first node
+        was discovered; each lists that first node first
+    """
+    node_count = len(graph)
+    index = [-1] * node_count
+    lowlink = [0] * node_count
+    on_stack = [False] * node_count
+    stack: List[int] = []
+    found: List[Tuple[int, List[int]]] = []
+    counter = 0
+    
+    for root in range(node_count):
+        if index[root] != -1:
+            continue
         
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                dfs(neighbor, path)
-            elif neighbor in rec_stack:
-                # Found a cycle
-                cycle_start = path.index(neighbor)
-                cycle = path[cycle_start:] + [neighbor]
-                if cycle not in cycles:
-                    cycles.append(cycle)
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work_stack = [(root, iter(graph[root]))]
         
-        path.pop()
-        rec_stack.remove(node)
+        while work_stack:
+            node, neighbors = work_stack[-1]
+            for neighbor in neighbors:
+                if index[neighbor] == -1:
+                    # Descend into an unvisited neighbor
+                    index[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = True
+                    work_stack.append((neighbor, iter(graph[neighbor])))
+                    break
+                if on_stack[neighbor]:
+                    lowlink[node] = min(lowlink[node], index[neighbor])
+            else:
+                # All neighbors done - finish this node
+                work_stack.pop()
+                if work_stack:
+                    parent = work_stack[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    
+                    if len(component) > 1 or node in graph[node]:
+                        component.reverse()
+                        found.append((index[node], component))
+    
+    # Report cycles in the order their first task was discovered
+    found.sort(key=lambda item: item[0])
+    return [component for _, component in found]
+
+
+def _find_cycles(
+    ids: List[str],
+    graph: List[List[int]],
+    components: Optional[List[List[int]]] = None
+) -> List[List[str]]:
+    """
+    One real cycle per cyclic component, as task IDs.
+    
+    Args:
+        ids: Task ID of each node
+        graph: Encoded adjacency list
+        components: The result of _cyclic_components(graph), if already built
+    """
+    if components is None:
+        components = _cyclic_components(graph)
+    return [
+        [ids[node] for node in _component_cycle(component[0], set(component), graph)]
+        for component in components
+    ]
+
+
+def _component_cycle(root: int, members: Set[int], graph: List[List[int]]) -> List[int]:
+    """
+    Shortest cycle through root that only follows edges inside its component.
     
-    for node in graph:
-        if node not in visited:
-            dfs(node, [])
+    A strongly connected component can hold several overlapping cycles,
+    so its members in discovery order are not necessarily a real path;
+    a breadth-first walk back to root is.
     
-    return cycles
+    Returns:
+        Node path starting and ending with root
+    """
+    parent = {root: root}
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph[node]:
+            if neighbor == root:
+                path = [root]
+                while node != root:
+                    path.append(node)
+                    node = parent[node]
+                path.append(root)
+                path.reverse()
+                return path
+            if neighbor in members and neighbor not in parent:
+                parent[neighbor] = node
+                queue.append(neighbor)
+    return [root, root]  # Unreachable for a strongly connected component
 
 
 def build_dependency_graph(tasks: List[Dict]) -> Dict[str, Any]:
@@ -469,46 +773,38 @@ def build_dependency_graph(tasks: List[Dict]) -> Dict[str, Any]:
         - circular_dependencies: List of detected cycles
         - has_circular: Boolean flag
     """
+    known_ids = _known_task_ids(tasks)
+    
+    # Detect circular dependencies first so nodes can be marked as built.
+    # Every task in a cyclic component is on some cycle, even if it is
+    # not on the one reported for that component.
+    ids, graph = _encode_dependency_graph(tasks, known_ids)
+    components = _cyclic_components(graph)
+    cycles = _find_cycles(ids, graph, components)
+    circular_node_ids = {ids[node] for node in chain.from_iterable(components)}
+    
+    # Create nodes and edges (from dependency to task that depends on it)
+    # in a single pass over the tasks
     nodes = []
     edges = []
-    
-    # Build task lookup
-    task_map = {task.get('id', str(i)): task for i, task in enumerate(tasks)}
-    
-    # Create nodes
     for task in tasks:
         task_id = task.get('id', '')
+        dependencies = task.get('dependencies') or ()
         nodes.append({
             'id': task_id,
             'title': task.get('title', 'Untitled'),
             'importance': task.get('importance', 5),
-            'dependencies_count': len(task.get('dependencies', [])),
+            'dependencies_count': len(dependencies),
+            'in_cycle': task_id in circular_node_ids,
         })
-    
-    # Create edges (from dependency to task that depends on it)
-    for task in tasks:
-        task_id = task.get('id', '')
-        dependencies = task.get('dependencies', [])
         for dep_id in dependencies:
-            if dep_id in task_map:
+            if dep_id in known_ids:
                 edges.append({
                     'from': dep_id,
                     'to': task_id,
                     'label': 'blocks'
                 })
     
-    # Detect circular dependencies
-    cycles = detect_circular_dependencies(tasks)
-    
-    # Mark nodes involved in cycles
-    circular_node_ids = set()
-    for cycle in cycles:
-        for node_id in cycle:
-            circular_node_ids.add(node_id)
-    
-    for node in nodes:
-        node['in_cycle'] = node['id'] in circular_node_ids
-    
     return {
         'nodes': nodes,
         'edges': edges,
@@ -519,12 +815,62 @@ def build_dependency_graph(tasks: List[Dict]) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1024)
+def _parse_due_date(value: str) -> Optional[date]:
+    """
+    Parse a YYYY-MM-DD due date string, returning None if it is invalid.
+    
+    date.fromisoformat handles the canonical zero-padded form in C; the
+    precompiled pattern keeps accepting unpadded months and days
+    (e.g. 2025-12-1) without going through strptime. Only strings of that
+    exact shape take the fast path, since fromisoformat also accepts
+    forms like 20251201 and 2025-W49-1. Results are memoized since a
+    batch of tasks usually shares a handful of due dates.
+    """
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    
+    match = _LOOSE_DATE_RE.fullmatch(value)
+    if match is None:
+        return None
+    try:
+        return date(*map(int, match.groups()))
+    except ValueError:
+        return None
+
+
+def _resolve_weights(
+    strategy: str = 'smart_balance',
+    custom_weights: Optional[Dict[str, float]] = None
+) -> Dict[str, float]:
+    """
+    Resolve the weight configuration for a strategy, normalized to sum to 1.
+    
+    Args:
+        strategy: Scoring strategy to use
+        custom_weights: Optional custom weight configuration
+        
+    Returns:
+        Dictionary of normalized weights keyed by factor name
+    """
+    if custom_weights:
+        return _normalize_weights({**DEFAULT_WEIGHTS, **custom_weights})
+    
+    return _NORMALIZED_STRATEGY_WEIGHTS.get(
+        strategy, _NORMALIZED_STRATEGY_WEIGHTS['smart_balance']
+    )
+
+
 def calculate_priority_score(
     task: Dict,
     all_tasks: List[Dict],
     strategy: str = 'smart_balance',
     custom_weights: Optional[Dict[str, float]] = None,
-    today: Optional[date] = None
+    today: Optional[date] = None,
+    blocking_counts: Optional[Dict[str, int]] = None
 ) -> Dict[str, Any]:
     """
     Calculate the overall priority score for a task.
@@ -538,6 +884,8 @@ def calculate_priority_score(
         strategy: Scoring strategy to use
         custom_weights: Optional custom weight configuration
         today: Current date (injectable for testing)
+        blocking_counts: Optional precomputed result of count_blocking_tasks,
+            so callers scoring many tasks build it once instead of per task
         
     Returns:
         Dictionary containing:
@@ -546,36 +894,76 @@ def calculate_priority_score(
         - explanation: Human-readable explanation
         - Component scores and other metadata
     """
-    # Get weights based on strategy
-    if custom_weights:
-        weights = {**DEFAULT_WEIGHTS, **custom_weights}
-    else:
-        weights = STRATEGY_WEIGHTS.get(strategy, DEFAULT_WEIGHTS)
+    if today is None:
+        today = date.today()
     
-    # Normalize weights to sum to 1
-    total_weight = sum(weights.values())
-    weights = {k: v / total_weight for k, v in weights.items()}
+    weights = _resolve_weights(strategy, custom_weights)
+    if blocking_counts is None:
+        blocking_counts = count_blocking_tasks(all_tasks)
+    return _score_task(task, blocking_counts, weights, strategy, today)
+
+
+def _component_scores(
+    due_date: date,
+    importance: int,
+    estimated_hours: int,
+    blocking_count: int,
+    today: date
+) -> Tuple[float, float, float, float, int, bool, int]:
+    """
+    Compute all four factor scores for one task.
+    
+    Uses the same public scoring functions the tests exercise; the
+    dependency score comes from the task's precomputed blocking count.
+    
+    Returns:
+        Tuple of (urgency, importance, effort, dependency, days_until_due,
+        is_overdue, working_days_until_due)
+    """
+    urgency_score, days_until_due, is_overdue, working_days = calculate_urgency_score(due_date, today)
+    
+    importance_score = calculate_importance_score(importance)
+    effort_score = calculate_effort_score(estimated_hours)
+    dependency_score = _dependency_points(blocking_count)
+    
+    return (urgency_score, importance_score, effort_score, dependency_score,
+            days_until_due, is_overdue, working_days)
+
+
+def _score_task(
+    task: Dict,
+    blocking_counts: Dict[str, int],
+    weights: Dict[str, float],
+    strategy: str,
+    today: date,
+    explain: bool = True
+) -> Dict[str, Any]:
+    """
+    Score a single task against already-resolved, normalized weights.
     
+    Shared by calculate_priority_score and the batch path in analyze_tasks,
+    which resolves the weights and blocking counts once per call instead
+    of once per task. With explain=False the explanation is left as None
+    for _explain_scored_task to fill in later.
+    """
     # Parse due date
     due_date = task.get('due_date')
     if isinstance(due_date, str):
-        try:
-            due_date = datetime.strptime(due_date, '%Y-%m-%d').date()
-        except ValueError:
-            due_date = date.today()  # Default to today if invalid
+        due_date = _parse_due_date(due_date) or today  # Default to today if invalid
     elif not isinstance(due_date, date):
-        due_date = date.today()
+        due_date = today
     
     # Get other task properties with defaults
     importance = task.get('importance', 5)
     estimated_hours = task.get('estimated_hours', 4)
     task_id = task.get('id', '')
+    blocking_count = blocking_counts.get(task_id, 0)
     
     # Calculate individual scores
-    urgency_score, days_until_due, is_overdue, working_days = calculate_urgency_score(due_date, today)
-    importance_score = calculate_importance_score(importance)
-    effort_score = calculate_effort_score(estimated_hours)
-    dependency_score, blocking_count = calculate_dependency_score(task_id, all_tasks)
+    (urgency_score, importance_score, effort_score, dependency_score,
+     days_until_due, is_overdue, working_days) = _component_scores(
+        due_date, importance, estimated_hours, blocking_count, today
+    )
     
     # Calculate weighted score
     weighted_score = (
@@ -593,33 +981,29 @@ def calculate_priority_score(
     else:
         priority_level = 'Low'
     
-    # Generate explanation
-    explanation = generate_explanation(
-        task=task,
-        urgency_score=urgency_score,
-        importance_score=importance_score,
-        effort_score=effort_score,
-        dependency_score=dependency_score,
-        days_until_due=days_until_due,
-        is_overdue=is_overdue,
-        blocking_count=blocking_count,
-        strategy=strategy,
-        weights=weights
-    )
+    # Generate explanation (may be deferred until the caller knows
+    # which tasks will actually be shown)
+    explanation = None
+    if explain:
+        explanation = generate_explanation(
+            task=task,
+            urgency_score=urgency_score,
+            importance_score=importance_score,
+            effort_score=effort_score,
+            dependency_score=dependency_score,
+            days_until_due=days_until_due,
+            is_overdue=is_overdue,
+            blocking_count=blocking_count,
+            strategy=strategy,
+            weights=weights
+        )
     
     # Eisenhower Matrix quadrant calculation
     # Urgent: urgency_score >= 60, Important: importance >= 7
     is_urgent = urgency_score >= 60 or is_overdue
     is_important = importance >= 7
     
-    if is_urgent and is_important:
-        eisenhower_quadrant = 'do_first'  # Quadrant 1: Do First
-    elif is_important and not is_urgent:
-        eisenhower_quadrant = 'schedule'   # Quadrant 2: Schedule
-    elif is_urgent and not is_important:
-        eisenhower_quadrant = 'delegate'   # Quadrant 3: Delegate
-    else:
-        eisenhower_quadrant = 'eliminate'  # Quadrant 4: Eliminate/Low Priority
+    eisenhower_quadrant = _EISENHOWER_QUADRANTS[(is_urgent << 1) | is_important]
     
     return {
         'id': task_id,
@@ -647,6 +1031,79 @@ def calculate_priority_score(
     }
 
 
+def _task_signature(task: Dict, blocking_counts: Dict[str, int]) -> Tuple:
+    """
+    Everything a task's score depends on, as a cache key.
+    
+    Any change to a field changes the signature, so cached scores never
+    go stale. Field types are part of the key because equal values such
+    as 5 and 5.0 (or 1 and True) would otherwise share a cached result
+    and echo back whichever was scored first.
+    """
+    task_id = task.get('id', '')
+    fields = (
+        task_id,
+        task.get('title', 'Untitled'),
+        task.get('due_date'),
+        task.get('importance', 5),
+        task.get('estimated_hours', 4),
+        tuple(task.get('dependencies', [])),
+    )
+    return (
+        *fields,
+        blocking_counts.get(task_id, 0),
+        tuple(map(type, fields[:5])) + tuple(map(type, fields[5])),
+    )
+
+
+@lru_cache(maxsize=SCORE_CACHE_SIZE)
+def _score_signature(
+    signature: Tuple,
+    weights_key: Tuple[Tuple[str, float], ...],
+    strategy: str,
+    today: date
+) -> Dict[str, Any]:
+    """
+    Score a task rebuilt from its signature, memoized across calls.
+    
+    Repeated analyses of a mostly unchanged task list (e.g. a polling UI)
+    only pay for the tasks that changed. Treat the result as read-only.
+    """
+    task_id, title, due_date, importance, hours, dependencies, blocking_count, _ = signature
+    task = {
+        'id': task_id,
+        'title': title,
+        'due_date': due_date,
+        'importance': importance,
+        'estimated_hours': hours,
+        'dependencies': list(dependencies),
+    }
+    return _score_task(
+        task, {task_id: blocking_count}, dict(weights_key), strategy, today, explain=False
+    )
+
+
+def _explain_scored_task(
+    scored: Dict[str, Any],
+    strategy: str,
+    weights: Dict[str, float]
+) -> None:
+    """Fill in the explanation of a task scored with explain=False."""
+    scores = scored['_scores']
+    scored['explanation'] = generate_explanation(
+        task=scored,
+        urgency_score=scores['urgency'],
+        importance_score=scores['importance'],
+        effort_score=scores['effort'],
+        dependency_score=scores['dependency'],
+        days_until_due=scored['days_until_due'],
+        is_overdue=scored['is_overdue'],
+        blocking_count=scored['blocking_count'],
+        strategy=strategy,
+        weights=weights
+    )
+
+
 def generate_explanation(
     task: Dict,
     urgency_score: float,
@@ -698,20 +1155,55 @@ def generate_explanation(
     if blocking_count > 0:
         factors.append(f"🔗 Blocks {blocking_count} other task(s)")
     
-    # Strategy note
-    strategy_names = {
-        'smart_balance': 'Balanced',
-        'fastest_wins': 'Quick Wins',
-        'high_impact': 'High Impact',
-        'deadline_driven': 'Deadline Focus'
-    }
-    
     if not factors:
         factors.append("Standard priority task")
     
     return " • ".join(factors)
 
 
+def _cycle_warnings(cycles: List[List[str]]) -> List[str]:
+    """Warning messages for cycles found by detect_circular_dependencies."""
+    return [
+        f"Circular dependency detected: {' → '.join(cycle)}"
+        for cycle in cycles
+    ]
+
+
+def _score_tasks(
+    tasks: List[Dict],
+    weights: Dict[str, float],
+    strategy: str,
+    today: date
+) -> List[Dict[str, Any]]:
+    """
+    Score every task (unsorted, without explanations).
+    
+    Blocking counts are resolved once for the whole batch, and unchanged
+    tasks are served from the _score_signature cache.
+    """
+    blocking_counts = count_blocking_tasks(tasks)
+    weights_key = tuple(weights.items())
+    scored_tasks = []
+    for task in tasks:
+        try:
+            signature = _task_signature(task, blocking_counts)
+            cached = _score_signature(signature, weights_key, strategy, today)
+        except TypeError:
+            # Unhashable field values cannot be cached; score directly
+            scored_tasks.append(
+                _score_task(task, blocking_counts, weights, strategy, today, explain=False)
+            )
+            continue
+        
+        # Each caller gets its own containers, so changing a result can
+        # never leak into the cache or later analyses
+        scored = cached.copy()
+        scored['dependencies'] = list(cached['dependencies'])
+        scored['_scores'] = cached['_scores'].copy()
+        scored_tasks.append(scored)
+    return scored_tasks
+
+
 def analyze_tasks(
     tasks: List[Dict],
     strategy: str = 'smart_balance',
@@ -735,31 +1227,23 @@ def analyze_tasks(
         - warnings: Any warnings (circular dependencies, etc.)
         - summary: Brief summary of the analysis
     """
-    warnings = []
+    if today is None:
+        today = date.today()  # Resolved once for the whole batch
     
-    # Detect circular dependencies
-    cycles = detect_circular_dependencies(tasks)
-    if cycles:
-        for cycle in cycles:
-            warnings.append(f"Circular dependency detected: {' → '.join(cycle)}")
-    
-    # Score all tasks
-    scored_tasks = []
-    for task in tasks:
-        scored = calculate_priority_score(
-            task=task,
-            all_tasks=tasks,
-            strategy=strategy,
-            custom_weights=custom_weights,
-            today=today
-        )
-        scored_tasks.append(scored)
+    weights = _resolve_weights(strategy, custom_weights)
+    scored_tasks = _score_tasks(tasks, weights, strategy, today)
     
     # Sort by priority score (descending)
-    scored_tasks.sort(key=lambda x: x['priority_score'], reverse=True)
+    scored_tasks.sort(key=_PRIORITY_KEY, reverse=True)
+    
+    # Every analyzed task is shown with its explanation
+    for task in scored_tasks:
+        _explain_scored_task(task, strategy, weights)
     
-    # Build dependency graph for visualization
+    # Build dependency graph for visualization; its cycle detection
+    # also provides the warnings
     dependency_graph = build_dependency_graph(tasks)
+    warnings = _cycle_warnings(dependency_graph['circular_dependencies'])
     
     # Build Eisenhower Matrix data
     eisenhower_matrix = {
@@ -769,20 +1253,24 @@ def analyze_tasks(
         'eliminate': [],     # Not Urgent + Not Important (Quadrant 4)
     }
     
+    # One pass fills the matrix (already in priority order) and the
+    # summary counts together
+    overdue_count = 0
+    high_priority_count = 0
     for task in scored_tasks:
-        quadrant = task.get('eisenhower_quadrant', 'eliminate')
-        eisenhower_matrix[quadrant].append({
+        eisenhower_matrix[task['eisenhower_quadrant']].append({
             'id': task['id'],
             'title': task['title'],
             'priority_score': task['priority_score'],
-            'is_urgent': task.get('is_urgent', False),
-            'is_important': task.get('is_important', False),
+            'is_urgent': task['is_urgent'],
+            'is_important': task['is_important'],
         })
+        if task['is_overdue']:
+            overdue_count += 1
+        if task['priority_level'] == 'High':
+            high_priority_count += 1
     
     # Generate summary
-    overdue_count = sum(1 for t in scored_tasks if t['is_overdue'])
-    high_priority_count = sum(1 for t in scored_tasks if t['priority_level'] == 'High')
-    
     summary_parts = [f"Analyzed {len(tasks)} task(s)"]
     if overdue_count:
         summary_parts.append(f"{overdue_count} overdue")
@@ -819,9 +1307,17 @@ def get_suggestions(
     Returns:
         Dictionary containing top tasks with detailed explanations
     """
-    analysis = analyze_tasks(tasks, strategy=strategy, today=today)
+    if today is None:
+        today = date.today()
+    
+    weights = _resolve_weights(strategy)
+    scored_tasks = _score_tasks(tasks, weights, strategy, today)
     
-    top_tasks = analysis['tasks'][:count]
+    # Partial selection: O(N log count) instead of sorting every task.
+    # nlargest is stable, so ties keep the same order as a full sort.
+    top_tasks = heapq.nlargest(count, scored_tasks, key=_PRIORITY_KEY)
+    for task in top_tasks:
+        _explain_scored_task(task, strategy, weights)
     
     # Add more detailed suggestions
     for i, task in enumerate(top_tasks, 1):
@@ -849,7 +1345,7 @@ def get_suggestions(
     return {
         'tasks': top_tasks,
         'summary': advice,
-        'warnings': analysis['warnings'],
+        'warnings': _cycle_warnings(detect_circular_dependencies(tasks)),
         'total_tasks': len(tasks)
     }
 
@@ -5,10 +5,99 @@ Provides serialization/deserialization for Task data with validation.
 """
 
 from rest_framework import serializers
+from rest_framework.serializers import as_serializer_error
 from datetime import date
+from secrets import token_hex
+import copy
 
 
-class TaskInputSerializer(serializers.Serializer):
+# Validation messages
+EMPTY_TITLE_MESSAGE = "Title cannot be empty"
+HOURS_TOO_HIGH_MESSAGE = "Estimated hours seems unreasonably high (max 1000)"
+
+# Scoring strategies accepted by the API, as (value, display name) pairs
+STRATEGY_CHOICES = (
+    ('smart_balance', 'Smart Balance'),
+    ('fastest_wins', 'Fastest Wins'),
+    ('high_impact', 'High Impact'),
+    ('deadline_driven', 'Deadline Driven'),
+)
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer's declared fields once per class.
+    
+    DRF deep-copies every declared field each time a serializer is
+    instantiated, which dominates the cost of validating many small
+    tasks. The first instance keeps its deep copy as a per-class
+    template; later instances take shallow copies of it, which is
+    enough since binding only sets attributes on the copy.
+    
+    Only use this on flat serializers: nested serializer fields would
+    end up sharing their child serializer between instances.
+    """
+    
+    def get_fields(self):
+        cls = type(self)
+        template = cls.__dict__.get('_fields_template')
+        if template is None:
+            template = super().get_fields()
+            cls._fields_template = template
+        return {name: copy.copy(field) for name, field in template.items()}
+
+
+class ISODateField(serializers.DateField):
+    """
+    DateField with a fast path for canonical YYYY-MM-DD strings.
+    
+    Those are parsed with the C date.fromisoformat; anything else (date
+    objects, unpadded or invalid strings) goes through DRF's usual
+    parsing, so accepted values and error messages are unchanged.
+    """
+    
+    def to_internal_value(self, value):
+        if type(value) is str and len(value) == 10 and value[4] == '-' and value[7] == '-':
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                pass
+        return super().to_internal_value(value)
+
+
+def _is_clean_string(value) -> bool:
+    """
+    True if CharField() would accept a value and return it unchanged.
+    
+    That means a non-blank str with no surrounding spaces, control
+    characters, null bytes or surrogates (all non-printable).
+    """
+    return (
+        type(value) is str and value.isprintable()
+        and value[:1] not in ('', ' ') and value[-1] != ' '
+    )
+
+
+class StringListField(serializers.ListField):
+    """
+    ListField of CharField() items with a fast path for clean input.
+    
+    When every item is already a string CharField would leave unchanged,
+    the per-item child validation is skipped; any other input is
+    validated item by item as usual, with the same error messages.
+    """
+    
+    def __init__(self, **kwargs):
+        kwargs['child'] = serializers.CharField()
+        super().__init__(**kwargs)
+    
+    def to_internal_value(self, data):
+        if type(data) is list and (data or self.allow_empty) and all(map(_is_clean_string, data)):
+            return list(data)
+        return super().to_internal_value(data)
+
+
+class TaskInputSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for incoming task data.
     
@@ -18,27 +107,24 @@ class TaskInputSerializer(serializers.Serializer):
     
     id = serializers.CharField(required=False, allow_blank=True)
     title = serializers.CharField(max_length=255)
-    due_date = serializers.DateField()
+    due_date = ISODateField()
     estimated_hours = serializers.IntegerField(min_value=1, default=1)
     importance = serializers.IntegerField(min_value=1, max_value=10, default=5)
-    dependencies = serializers.ListField(
-        child=serializers.CharField(),
-        required=False,
-        default=list
-    )
+    dependencies = StringListField(required=False, default=list)
     
     def validate_title(self, value):
         """Ensure title is not empty or just whitespace."""
-        if not value or not value.strip():
-            raise serializers.ValidationError("Title cannot be empty")
-        return value.strip()
+        title = value.strip() if value else ''
+        if not title:
+            raise serializers.ValidationError(EMPTY_TITLE_MESSAGE)
+        return title
     
     def validate_estimated_hours(self, value):
         """Ensure estimated hours is reasonable."""
         if value <= 0:
             return 1  # Default to 1 hour for invalid values
         if value > 1000:
-            raise serializers.ValidationError("Estimated hours seems unreasonably high (max 1000)")
+            raise serializers.ValidationError(HOURS_TOO_HIGH_MESSAGE)
         return value
     
     def validate(self, data):
@@ -48,13 +134,44 @@ class TaskInputSerializer(serializers.Serializer):
         """
         # Generate ID if not provided
         if 'id' not in data or not data['id']:
-            import uuid
-            data['id'] = str(uuid.uuid4())[:8]
+            data['id'] = token_hex(4)  # 8 hex characters
         
         return data
 
 
-class TaskOutputSerializer(serializers.Serializer):
+# Shared validator for validate_task_list; its fields are bound on first
+# use and then reused by every request
+_TASK_VALIDATOR = TaskInputSerializer()
+
+
+def validate_task_list(tasks):
+    """
+    Validate each task independently, keeping the ones that pass.
+    
+    A single module-level TaskInputSerializer validates every item, the
+    way DRF's ListSerializer reuses its child, instead of building and
+    binding a serializer per task (or per request). run_validation keeps
+    no per-call state on the serializer, so sharing it is safe. Unlike
+    many=True, one invalid task does not discard the rest.
+    
+    Args:
+        tasks: List of raw task dictionaries
+        
+    Returns:
+        Tuple of (validated_tasks, errors) where errors is a list of
+        (index, error_detail) pairs for the tasks that failed
+    """
+    validated_tasks = []
+    errors = []
+    for i, task in enumerate(tasks):
+        try:
+            validated_tasks.append(_TASK_VALIDATOR.run_validation(task))
+        except serializers.ValidationError as exc:
+            errors.append((i, as_serializer_error(exc)))
+    return validated_tasks, errors
+
+
+class TaskOutputSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for task output with calculated priority score.
     
@@ -67,7 +184,7 @@ class TaskOutputSerializer(serializers.Serializer):
     due_date = serializers.DateField()
     estimated_hours = serializers.IntegerField()
     importance = serializers.IntegerField()
-    dependencies = serializers.ListField(child=serializers.CharField())
+    dependencies = StringListField()
     priority_score = serializers.FloatField()
     priority_level = serializers.CharField()  # High, Medium, Low
     explanation = serializers.CharField()
@@ -85,12 +202,7 @@ class AnalyzeRequestSerializer(serializers.Serializer):
     
     tasks = TaskInputSerializer(many=True)
     strategy = serializers.ChoiceField(
-        choices=[
-            ('smart_balance', 'Smart Balance'),
-            ('fastest_wins', 'Fastest Wins'),
-            ('high_impact', 'High Impact'),
-            ('deadline_driven', 'Deadline Driven'),
-        ],
+        choices=STRATEGY_CHOICES,
         default='smart_balance',
         required=False
     )
@@ -108,5 +220,5 @@ class SuggestResponseSerializer(serializers.Serializer):
     
     tasks = TaskOutputSerializer(many=True)
     summary = serializers.CharField()
-    warnings = serializers.ListField(child=serializers.CharField(), required=False)
+    warnings = StringListField(required=False)
 
@@ -5,13 +5,18 @@ These tests verify the core scoring logic handles various scenarios
 correctly including edge cases.
 """
 
+import copy
 import unittest
 from datetime import date, timedelta
+from unittest import mock
+from rest_framework.test import APIClient
+from . import views
 from .scoring import (
     calculate_urgency_score,
     calculate_importance_score,
     calculate_effort_score,
     calculate_dependency_score,
+    count_blocking_tasks,
     calculate_priority_score,
     detect_circular_dependencies,
     analyze_tasks,
@@ -22,9 +27,7 @@ from .scoring import (
 class TestUrgencyScore(unittest.TestCase):
     """Tests for urgency score calculation."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.today = date(2025, 11, 29)  # Fixed date for testing
+    today = date(2025, 11, 29)  # Fixed date for testing
     
     def test_overdue_task_gets_high_urgency(self):
         """Overdue tasks should have urgency > 100."""
@@ -177,6 +180,21 @@ class TestDependencyScore(unittest.TestCase):
         
         self.assertEqual(count, 3)
         self.assertEqual(score, 60)  # 3 * 20
+    
+    def test_precomputed_blocking_counts(self):
+        """Precomputed blocking counts should match a direct scan."""
+        tasks = [
+            {'id': 'A', 'dependencies': []},
+            {'id': 'B', 'dependencies': ['A', 'A']},  # Duplicate counts once
+            {'id': 'C', 'dependencies': ['A', 'B']},
+        ]
+        blocking_counts = count_blocking_tasks(tasks)
+        
+        for task_id in ('A', 'B', 'C'):
+            self.assertEqual(
+                calculate_dependency_score(task_id, tasks, blocking_counts),
+                calculate_dependency_score(task_id, tasks)
+            )
 
 
 class TestCircularDependencyDetection(unittest.TestCase):
@@ -210,13 +228,40 @@ class TestCircularDependencyDetection(unittest.TestCase):
         ]
         cycles = detect_circular_dependencies(tasks)
         self.assertGreater(len(cycles), 0)
+    
+    def test_deep_chain_does_not_recurse(self):
+        """Long dependency chains should not hit the recursion limit."""
+        tasks = [{'id': '0', 'dependencies': []}] + [
+            {'id': str(i), 'dependencies': [str(i - 1)]} for i in range(1, 5000)
+        ]
+        tasks[0]['dependencies'] = ['4999']  # Close the loop
+        
+        cycles = detect_circular_dependencies(tasks)
+        
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(len(cycles[0]), 5001)
+        self.assertEqual(cycles[0][0], cycles[0][-1])
+    
+    def test_reported_cycle_follows_real_edges(self):
+        """Overlapping cycles should not be reported as one made-up path."""
+        from tasks.scoring import build_dependency_graph
+        
+        tasks = [
+            {'id': 'A', 'dependencies': ['B', 'C']},
+            {'id': 'B', 'dependencies': ['A']},
+            {'id': 'C', 'dependencies': ['A']},
+        ]
+        cycles = detect_circular_dependencies(tasks)
+        
+        self.assertEqual(cycles, [['A', 'B', 'A']])
+        graph = build_dependency_graph(tasks)
+        self.assertTrue(all(node['in_cycle'] for node in graph['nodes']))
 
 
 class TestPriorityScoreCalculation(unittest.TestCase):
     """Tests for overall priority score calculation."""
     
-    def setUp(self):
-        self.today = date(2025, 11, 29)
+    today = date(2025, 11, 29)
     
     def test_high_priority_task(self):
         """Task with urgency + importance should be high priority."""
@@ -286,13 +331,31 @@ class TestPriorityScoreCalculation(unittest.TestCase):
         )
         self.assertGreater(important_result2['priority_score'], quick_result2['priority_score'])
 
+    def test_precomputed_blocking_counts_match(self):
+        """Passing blocking counts should give the same result as computing them."""
+        blocker = {'id': 'a', 'title': 'Blocker', 'due_date': self.today,
+                   'estimated_hours': 3, 'importance': 6, 'dependencies': []}
+        blocked = {'id': 'b', 'title': 'Blocked', 'due_date': self.today,
+                   'estimated_hours': 3, 'importance': 6, 'dependencies': ['a']}
+        tasks = [blocker, blocked]
+        
+        computed = calculate_priority_score(blocker, tasks, today=self.today)
+        precomputed = calculate_priority_score(
+            blocker, tasks, today=self.today,
+            blocking_counts=count_blocking_tasks(tasks)
+        )
+        self.assertEqual(computed, precomputed)
+        self.assertEqual(precomputed['blocking_count'], 1)
+
 
 class TestAnalyzeTasks(unittest.TestCase):
     """Tests for the main analyze_tasks function."""
     
-    def setUp(self):
-        self.today = date(2025, 11, 29)
-        self.sample_tasks = [
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.today = date(2025, 11, 29)
+        cls.sample_tasks = [
             {
                 'id': '1',
                 'title': 'Low priority task',
@@ -318,10 +381,12 @@ class TestAnalyzeTasks(unittest.TestCase):
                 'dependencies': []
             }
         ]
+        # Shared by the tests that only read the default analysis
+        cls.result = analyze_tasks(cls.sample_tasks, today=cls.today)
     
     def test_tasks_are_sorted_by_priority(self):
         """Tasks should be returned sorted by priority score (descending)."""
-        result = analyze_tasks(self.sample_tasks, today=self.today)
+        result = self.result
         
         self.assertEqual(len(result['tasks']), 3)
         
@@ -330,7 +395,7 @@ class TestAnalyzeTasks(unittest.TestCase):
     
     def test_result_contains_required_fields(self):
         """Result should contain all required fields."""
-        result = analyze_tasks(self.sample_tasks, today=self.today)
+        result = self.result
         
         self.assertIn('tasks', result)
         self.assertIn('summary', result)
@@ -340,14 +405,47 @@ class TestAnalyzeTasks(unittest.TestCase):
             self.assertIn('priority_score', task)
             self.assertIn('priority_level', task)
             self.assertIn('explanation', task)
+    
+    def test_repeat_analysis_reuses_cached_scores(self):
+        """Re-analyzing an unchanged task list should hit the score cache."""
+        from tasks.scoring import _score_signature
+        
+        first = analyze_tasks(self.sample_tasks, today=self.today)
+        hits_before = _score_signature.cache_info().hits
+        second = analyze_tasks(self.sample_tasks, today=self.today)
+        
+        self.assertEqual(first, second)
+        self.assertGreaterEqual(
+            _score_signature.cache_info().hits - hits_before, len(self.sample_tasks)
+        )
+    
+    def test_score_cache_keeps_field_types(self):
+        """Equal values of different types should not share a cached score."""
+        task = {'id': 'typed', 'title': 'Typed', 'due_date': '2025-12-05'}
+        analyze_tasks([{**task, 'importance': 5, 'estimated_hours': 2}], today=self.today)
+        result = analyze_tasks([{**task, 'importance': 5.0, 'estimated_hours': 2.0}], today=self.today)
+        
+        self.assertIsInstance(result['tasks'][0]['importance'], float)
+        self.assertIsInstance(result['tasks'][0]['estimated_hours'], float)
+    
+    def test_changing_a_result_does_not_affect_later_analyses(self):
+        """Cached scores should not share containers with returned tasks."""
+        first = analyze_tasks(self.sample_tasks, today=self.today)
+        expected = copy.deepcopy(first)
+        first['tasks'][0]['dependencies'].append('extra')
+        first['tasks'][0]['_scores']['urgency'] = -1
+        
+        self.assertEqual(analyze_tasks(self.sample_tasks, today=self.today), expected)
 
 
 class TestGetSuggestions(unittest.TestCase):
     """Tests for the get_suggestions function."""
     
-    def setUp(self):
-        self.today = date(2025, 11, 29)
-        self.sample_tasks = [
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.today = date(2025, 11, 29)
+        cls.sample_tasks = [
             {'id': '1', 'title': 'Task 1', 'due_date': '2025-12-01', 
              'estimated_hours': 2, 'importance': 8, 'dependencies': []},
             {'id': '2', 'title': 'Task 2', 'due_date': '2025-12-05',
@@ -357,10 +455,12 @@ class TestGetSuggestions(unittest.TestCase):
             {'id': '4', 'title': 'Task 4', 'due_date': '2025-12-15',
              'estimated_hours': 16, 'importance': 2, 'dependencies': []},
         ]
+        # Shared by the tests that only read the default suggestions
+        cls.result = get_suggestions(cls.sample_tasks, today=cls.today)
     
     def test_returns_top_3_by_default(self):
         """Should return top 3 tasks by default."""
-        result = get_suggestions(self.sample_tasks, today=self.today)
+        result = self.result
         
         self.assertEqual(len(result['tasks']), 3)
     
@@ -372,14 +472,14 @@ class TestGetSuggestions(unittest.TestCase):
     
     def test_includes_suggestion_text(self):
         """Each task should include suggestion text."""
-        result = get_suggestions(self.sample_tasks, today=self.today)
+        result = self.result
         
         for task in result['tasks']:
             self.assertIn('suggestion', task)
     
     def test_includes_summary_advice(self):
         """Result should include summary advice."""
-        result = get_suggestions(self.sample_tasks, today=self.today)
+        result = self.result
         
         self.assertIn('summary', result)
         self.assertTrue(len(result['summary']) > 0)
@@ -421,6 +521,17 @@ class TestEdgeCases(unittest.TestCase):
         # Should not raise an exception
         result = calculate_priority_score(task, [task])
         self.assertIn('priority_score', result)
+    
+    def test_invalid_date_defaults_to_injected_today(self):
+        """Invalid dates should fall back to the injected current date."""
+        today = date(2025, 11, 29)
+        for due_date in ('not-a-date', '20251201', '2025-W49-1'):
+            task = {'id': 'bad', 'title': 'Bad Date', 'due_date': due_date}
+            
+            result = calculate_priority_score(task, [task], today=today)
+            
+            self.assertEqual(result['due_date'], today.isoformat(), due_date)
+            self.assertEqual(result['days_until_due'], 0)
 
 
 class TestDateIntelligence(unittest.TestCase):
@@ -470,13 +581,42 @@ class TestDateIntelligence(unittest.TestCase):
         
         self.assertFalse(is_working_day(christmas))
         self.assertFalse(is_working_day(new_year))
+    
+    def test_working_days_match_day_by_day_count(self):
+        """Closed-form count should match checking each day individually."""
+        from tasks.scoring import count_working_days, is_working_day
+        
+        start = date(2025, 11, 20)
+        for span in range(0, 120):
+            end = start + timedelta(days=span)
+            expected = sum(
+                1 for offset in range(span + 1)
+                if is_working_day(start + timedelta(days=offset))
+            )
+            self.assertEqual(count_working_days(start, end), expected)
+    
+    def test_clearing_date_caches_rescores_after_holiday_change(self):
+        """Replacing HOLIDAYS and clearing caches should change cached scores."""
+        from tasks import scoring
+        
+        tasks = [{'id': 'h', 'title': 'Holiday check', 'due_date': '2025-12-05'}]
+        today = date(2025, 12, 1)
+        before = analyze_tasks(tasks, today=today)['tasks'][0]
+        
+        self.addCleanup(scoring.clear_date_caches)
+        with mock.patch('tasks.scoring.HOLIDAYS', scoring.HOLIDAYS | {(12, 3)}):
+            scoring.clear_date_caches()
+            after = analyze_tasks(tasks, today=today)['tasks'][0]
+        
+        self.assertEqual(
+            after['working_days_until_due'], before['working_days_until_due'] - 1
+        )
 
 
 class TestEisenhowerMatrix(unittest.TestCase):
     """Tests for Eisenhower Matrix quadrant assignment."""
     
-    def setUp(self):
-        self.today = date(2025, 11, 29)
+    today = date(2025, 11, 29)
     
     def test_urgent_important_task(self):
         """Task due soon with high importance should be 'do_first'."""
@@ -610,6 +750,240 @@ class TestLearningSystem(unittest.TestCase):
         self.assertEqual(stats['total_feedback'], 0)
         self.assertEqual(stats['helpful_count'], 0)
 
+    def test_feedback_history_is_bounded(self):
+        """History should keep only the most recent feedback events."""
+        from tasks.scoring import FEEDBACK_HISTORY_SIZE, LearningSystem
+        
+        system = LearningSystem()
+        for _ in range(FEEDBACK_HISTORY_SIZE + 10):
+            system.record_feedback({'_scores': {}, 'priority_score': 50}, True)
+        
+        self.assertEqual(len(system.feedback_history), FEEDBACK_HISTORY_SIZE)
+        self.assertEqual(system.get_statistics()['total_feedback'], FEEDBACK_HISTORY_SIZE + 10)
+    
+    def test_history_can_be_disabled(self):
+        """Without history tracking, feedback should still update learning."""
+        from tasks.scoring import LearningSystem
+        
+        system = LearningSystem(track_history=False)
+        stats = system.record_feedback({
+            '_scores': {'urgency': 90, 'importance': 50, 'effort': 50, 'dependency': 50},
+            'priority_score': 70
+        }, was_helpful=True)
+        
+        self.assertEqual(len(system.feedback_history), 0)
+        self.assertEqual(stats['total_feedback'], 1)
+        self.assertGreater(stats['weight_adjustments']['urgency'], 0)
+    
+    def test_adjusted_weights_refresh_after_feedback(self):
+        """Reused adjusted weights should not survive new feedback."""
+        from tasks.scoring import LearningSystem
+        
+        system = LearningSystem()
+        base_weights = {'urgency': 0.35, 'importance': 0.30, 'effort': 0.20, 'dependency': 0.15}
+        
+        first = system.get_adjusted_weights(base_weights)
+        first['urgency'] = 0  # Callers may mutate their copy
+        self.assertAlmostEqual(system.get_adjusted_weights(base_weights)['urgency'], 0.35)
+        
+        system.record_feedback({
+            '_scores': {'urgency': 100, 'importance': 50, 'effort': 50, 'dependency': 50},
+            'priority_score': 70
+        }, was_helpful=True)
+        self.assertGreater(system.get_adjusted_weights(base_weights)['urgency'], 0.35)
+
+
+class TestSerializers(unittest.TestCase):
+    """Tests for the task serializers."""
+    
+    def test_instances_do_not_share_bound_fields(self):
+        """Each serializer instance should bind its own field copies."""
+        from tasks.serializers import TaskInputSerializer
+        
+        first = TaskInputSerializer(data={'title': 'A', 'due_date': '2025-12-01'})
+        second = TaskInputSerializer(data={'title': ' ', 'due_date': '2025-12-01'})
+        
+        self.assertTrue(first.is_valid())
+        self.assertFalse(second.is_valid())
+        self.assertIn('title', second.errors)
+        self.assertIsNot(first.fields['title'], second.fields['title'])
+        self.assertIs(first.fields['title'].parent, first)
+    
+    def test_due_date_parsing(self):
+        """ISO dates should parse directly; other inputs keep DRF's handling."""
+        from tasks.serializers import TaskInputSerializer
+        
+        cases = {
+            '2025-12-01': date(2025, 12, 1),
+            '2025-12-1': date(2025, 12, 1),
+            date(2025, 12, 1): date(2025, 12, 1),
+        }
+        for value, expected in cases.items():
+            serializer = TaskInputSerializer(data={'title': 'A', 'due_date': value})
+            self.assertTrue(serializer.is_valid(), value)
+            self.assertEqual(serializer.validated_data['due_date'], expected)
+        
+        for value in ('2025-13-01', 'soon'):
+            serializer = TaskInputSerializer(data={'title': 'A', 'due_date': value})
+            self.assertFalse(serializer.is_valid(), value)
+            self.assertIn('due_date', serializer.errors)
+    
+    def test_dependency_list_matches_charfield_list(self):
+        """The string-list fast path should agree with a plain CharField list."""
+        from rest_framework import serializers
+        from tasks.serializers import StringListField
+        
+        reference = serializers.ListField(child=serializers.CharField())
+        field = StringListField()
+        for data in (['a', 'b c'], [' a', 'b\n'], [''], [1], ['a\x00'], 'a', []):
+            try:
+                expected = reference.run_validation(data)
+            except serializers.ValidationError as exc:
+                with self.assertRaises(serializers.ValidationError) as ctx:
+                    field.run_validation(data)
+                self.assertEqual(ctx.exception.detail, exc.detail)
+            else:
+                self.assertEqual(field.run_validation(data), expected)
+
+
+class TestAnalyzeView(unittest.TestCase):
+    """Tests for the analyze and suggest endpoints."""
+    
+    def setUp(self):
+        # Responses are cached per process; start every test cold
+        with views._response_cache_lock:
+            views._response_cache.clear()
+    
+    def test_repeat_requests_do_not_accumulate_warnings(self):
+        """Cached analyses should not be modified by per-request warnings."""
+        client = APIClient()
+        tasks = [
+            {'id': 'a', 'title': 'Valid', 'due_date': '2025-12-01'},
+            {'id': 'b', 'title': 'Invalid', 'due_date': 'soon'},
+        ]
+        
+        responses = [
+            client.post('/api/tasks/analyze/', tasks, format='json').json()
+            for _ in range(2)
+        ]
+        self.assertEqual(responses[0], responses[1])
+        self.assertEqual(len(responses[1]['warnings']), 1)
+        self.assertEqual(len(responses[1]['tasks']), 1)
+    
+    def test_response_cache_is_keyed_on_raw_payload(self):
+        """Repeats hit the cache; large batches and generated IDs are not cached."""
+        client = APIClient()
+        tasks = [{'id': 'cached', 'title': 'Cached', 'due_date': '2025-12-02'}]
+        
+        with mock.patch('tasks.views.analyze_tasks', wraps=views.analyze_tasks) as spy:
+            first = client.post('/api/tasks/analyze/', tasks, format='json').json()
+            second = client.post('/api/tasks/analyze/', tasks, format='json').json()
+            self.assertEqual(first, second)
+            self.assertEqual(spy.call_count, 1)
+            
+            with mock.patch('tasks.views.CACHEABLE_TASKS', 0):
+                tasks = [{'id': 'big', 'title': 'Not cached', 'due_date': '2025-12-02'}]
+                for _ in range(2):
+                    client.post('/api/tasks/analyze/', tasks, format='json')
+            self.assertEqual(spy.call_count, 3)
+            
+            # Each client gets its own generated IDs
+            tasks = [{'title': 'No ID', 'due_date': '2025-12-02'}]
+            ids = {
+                client.post('/api/tasks/analyze/', tasks, format='json').json()['tasks'][0]['id']
+                for _ in range(2)
+            }
+            self.assertEqual(spy.call_count, 5)
+            self.assertEqual(len(ids), 2)
+    
+    def test_large_results_stream_same_json(self):
+        """Large analyses should stream the same bytes JSONRenderer would produce."""
+        import json
+        from rest_framework.renderers import JSONRenderer
+        from tasks.views import STREAMING_THRESHOLD
+        
+        tasks = [
+            {'id': str(i), 'title': f'Task {i}\u2028é', 'due_date': '2025-12-01',
+             'importance': i % 10 + 1, 'dependencies': [str(i - 1)] if i else []}
+            for i in range(STREAMING_THRESHOLD + 1)
+        ]
+        response = APIClient().post('/api/tasks/analyze/', tasks, format='json')
+        
+        self.assertTrue(response.streaming)
+        body = b''.join(response.streaming_content)
+        self.assertEqual(body, JSONRenderer().render(json.loads(body)))
+        self.assertEqual(len(json.loads(body)['tasks']), len(tasks))
+    
+    def test_rejects_malformed_and_oversized_batches(self):
+        """Non-list and oversized task batches should be rejected up front."""
+        client = APIClient()
+        tasks = [{'title': f'Task {i}', 'due_date': '2025-12-01'} for i in range(3)]
+        
+        response = client.post('/api/tasks/suggest/', {'tasks': None}, format='json')
+        self.assertEqual(response.status_code, 400)
+        
+        with mock.patch('tasks.views.MAX_TASKS_PER_REQUEST', 2):
+            for path, body in (('/api/tasks/analyze/', tasks),
+                               ('/api/tasks/analyze/', {'tasks': tasks}),
+                               ('/api/tasks/suggest/', tasks)):
+                response = client.post(path, body, format='json')
+                self.assertEqual(response.status_code, 413, path)
+    
+    def test_unexpected_errors_return_json(self):
+        """Errors escaping a view should come back as JSON under 'error'."""
+        client = APIClient()
+        tasks = [{'title': 'Task', 'due_date': '2025-12-01'}]
+        
+        with mock.patch('tasks.views.analyze_tasks', side_effect=RuntimeError('boom')):
+            response = client.post('/api/tasks/analyze/', tasks, format='json')
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {'error': 'Internal error: boom'})
+        
+        response = client.post(
+            '/api/tasks/analyze/', '{not json', content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('JSON parse error', response.json()['error'])
+        
+        with mock.patch('tasks.views.get_suggestions', side_effect=ValueError('bad')):
+            response = client.post('/api/tasks/suggest/', tasks, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'Invalid parameter: bad'})
+    
+    def test_repeat_suggestions_are_cached(self):
+        """Identical suggest requests should reuse the earlier result."""
+        import json
+        
+        client = APIClient()
+        tasks = [{'id': 'cached', 'title': 'Cached suggestion', 'due_date': '2025-12-01'}]
+        
+        with mock.patch('tasks.views.get_suggestions', wraps=views.get_suggestions) as spy:
+            # Counts above the number of tasks share one entry
+            first = client.post('/api/tasks/suggest/?count=5', tasks, format='json')
+            second = client.post('/api/tasks/suggest/?count=9', tasks, format='json')
+            self.assertEqual(first.json(), second.json())
+            self.assertEqual(spy.call_count, 1)
+            
+            query = {'tasks': json.dumps(tasks)}
+            for _ in range(2):
+                client.get('/api/tasks/suggest/', query)
+            self.assertEqual(spy.call_count, 2)
+            
+            # Generated IDs are never shared between clients
+            tasks = [{'title': 'No ID', 'due_date': '2025-12-01'}]
+            for _ in range(2):
+                client.post('/api/tasks/suggest/', tasks, format='json')
+            self.assertEqual(spy.call_count, 4)
+    
+    def test_suggest_rejects_non_positive_count(self):
+        """count must be a positive integer."""
+        client = APIClient()
+        tasks = [{'title': 'Task', 'due_date': '2025-12-01'}]
+        
+        for count in ('-1', '0', 'abc'):
+            response = client.post(f'/api/tasks/suggest/?count={count}', tasks, format='json')
+            self.assertEqual(response.status_code, 400, count)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,18 +9,171 @@ Endpoints:
 - GET /api/tasks/suggest/ - Get top 3 task suggestions
 """
 
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
 from rest_framework import status
+from collections import OrderedDict
 from datetime import date
+from typing import Dict, Optional, Tuple
+import hashlib
 import json
+import threading
 
 from .serializers import (
+    STRATEGY_CHOICES,
     AnalyzeRequestSerializer,
-    TaskInputSerializer,
-    TaskOutputSerializer,
+    validate_task_list,
 )
-from .scoring import analyze_tasks, get_suggestions, learning_system
+from .scoring import STRATEGY_WEIGHTS, analyze_tasks, get_suggestions, learning_system
+
+
+STRATEGY_DESCRIPTIONS = {
+    'smart_balance': 'Balanced approach considering urgency, importance, effort, and dependencies',
+    'fastest_wins': 'Prioritize quick, low-effort tasks to build momentum',
+    'high_impact': 'Focus on the most important tasks first',
+    'deadline_driven': 'Prioritize based on approaching deadlines',
+}
+
+# The strategies listing never changes, so it is rendered to JSON once
+_STRATEGIES_JSON = JSONRenderer().render({
+    'strategies': {
+        key: {
+            'name': name,
+            'description': STRATEGY_DESCRIPTIONS[key],
+            'weights': STRATEGY_WEIGHTS[key],
+        }
+        for key, name in STRATEGY_CHOICES
+    },
+    'default': 'smart_balance'
+})
+
+RESPONSE_CACHE_SIZE = 64  # Cached analyze/suggest responses kept per process
+CACHEABLE_TASKS = 100  # Only responses for batches up to this size are cached
+CACHEABLE_BODY_BYTES = 32 * 1024  # Larger payloads are not hashed or cached
+MAX_TASKS_PER_REQUEST = 10_000  # Larger batches are rejected before validation
+STREAMING_THRESHOLD = 256  # Stream analyze responses with more tasks than this
+STREAM_BATCH_SIZE = 64  # Tasks encoded per streamed chunk
+
+# Same settings JSONRenderer uses, so streamed output is byte-identical
+_JSON_ENCODER = encoders.JSONEncoder(
+    ensure_ascii=not api_settings.UNICODE_JSON,
+    allow_nan=not api_settings.STRICT_JSON,
+    separators=(',', ':') if api_settings.COMPACT_JSON else (', ', ': ')
+)
+
+# Small analyze and suggest responses keyed by (view, payload digest,
+# params, date).
+# Bounded both by entry count and by batch size, so a client sending
+# many distinct payloads cannot grow it without limit.
+_response_cache: 'OrderedDict[Tuple, Dict]' = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _too_many_tasks(tasks) -> bool:
+    """Whether a raw task list is over MAX_TASKS_PER_REQUEST."""
+    return isinstance(tasks, list) and len(tasks) > MAX_TASKS_PER_REQUEST
+
+
+def _too_many_tasks_response():
+    return Response(
+        {'error': f'Too many tasks (max {MAX_TASKS_PER_REQUEST} per request)'},
+        status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    )
+
+
+def _stream_json(result):
+    """
+    Yield a result dict as UTF-8 JSON, its 'tasks' list a batch at a time.
+    
+    The full response body is never held in memory at once, and the
+    first bytes go out before the whole list is encoded.
+    """
+    encode = _JSON_ENCODER.encode
+    item_separator = _JSON_ENCODER.item_separator
+    key_separator = _JSON_ENCODER.key_separator
+    
+    def chunk(text):
+        # Escape line/paragraph separators as JSONRenderer does
+        return text.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode()
+    
+    yield b'{'
+    for n, (key, value) in enumerate(result.items()):
+        prefix = item_separator if n else ''
+        if key != 'tasks':
+            yield chunk(prefix + encode(key) + key_separator + encode(value))
+            continue
+        
+        yield chunk(prefix + encode(key) + key_separator + '[')
+        for start in range(0, len(value), STREAM_BATCH_SIZE):
+            batch = item_separator.join(map(encode, value[start:start + STREAM_BATCH_SIZE]))
+            yield chunk((item_separator if start else '') + batch)
+        yield b']'
+    yield b'}'
+
+
+def _payload_digest(raw: bytes) -> Optional[bytes]:
+    """
+    Digest a raw request payload for use in a response cache key.
+    
+    The payload is hashed as sent, before missing task IDs are generated,
+    so identical requests map to the same key. Payloads larger than
+    CACHEABLE_BODY_BYTES are not cached (None).
+    """
+    if not raw or len(raw) > CACHEABLE_BODY_BYTES:
+        return None
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _body_digest(request) -> Optional[bytes]:
+    """
+    _payload_digest of the request body, read only when it is small.
+    
+    Must be called before request.data, which consumes the body stream.
+    """
+    try:
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        return None
+    if not 0 < length <= CACHEABLE_BODY_BYTES:
+        return None
+    return _payload_digest(request.body)
+
+
+def _cached_response(key: Tuple) -> Optional[Dict]:
+    """Look up a cached response payload; callers must not modify it."""
+    with _response_cache_lock:
+        result = _response_cache.get(key)
+        if result is not None:
+            _response_cache.move_to_end(key)
+        return result
+
+
+def _has_own_ids(tasks) -> bool:
+    """
+    Whether every submitted task carries its own ID.
+    
+    Tasks without one get a random ID during validation; caching that
+    response would hand the same "random" IDs to every later client.
+    """
+    return all(
+        isinstance(task, dict) and str(task.get('id') or '').strip()
+        for task in tasks
+    )
+
+
+def _cache_response(key: Tuple, result: Dict, task_count: int) -> None:
+    """Cache a response payload for a small batch, evicting the oldest entries."""
+    if task_count > CACHEABLE_TASKS:
+        return
+    with _response_cache_lock:
+        _response_cache[key] = result
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
 
 
 class AnalyzeTasksView(APIView):
@@ -58,84 +211,90 @@ class AnalyzeTasksView(APIView):
     
     def post(self, request):
         """Handle POST request to analyze tasks."""
-        try:
-            # Parse request data
-            data = request.data
-            
-            # Handle both direct task list and wrapped format
-            if isinstance(data, list):
-                # Direct list of tasks
-                tasks = data
-                strategy = request.query_params.get('strategy', 'smart_balance')
-                custom_weights = None
-            else:
-                # Wrapped format with tasks key
-                serializer = AnalyzeRequestSerializer(data=data)
-                if not serializer.is_valid():
-                    return Response(
-                        {
-                            'error': 'Validation failed',
-                            'details': serializer.errors
-                        },
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-                
-                validated_data = serializer.validated_data
-                tasks = validated_data.get('tasks', [])
-                strategy = validated_data.get('strategy', 'smart_balance')
-                custom_weights = validated_data.get('weights')
-            
-            # Validate individual tasks
-            validated_tasks = []
-            validation_errors = []
-            
-            for i, task in enumerate(tasks):
-                task_serializer = TaskInputSerializer(data=task)
-                if task_serializer.is_valid():
-                    validated_tasks.append(task_serializer.validated_data)
-                else:
-                    validation_errors.append({
-                        'index': i,
-                        'task': task.get('title', f'Task {i}'),
-                        'errors': task_serializer.errors
-                    })
-            
-            # If all tasks failed validation, return error
-            if validation_errors and not validated_tasks:
+        # Identical small payloads reuse the earlier response
+        digest = _body_digest(request)
+        cache_key = None
+        if digest is not None:
+            cache_key = ('analyze', digest, request.query_params.get('strategy'), date.today())
+            cached = _cached_response(cache_key)
+            if cached is not None:
+                return Response(cached, status=status.HTTP_200_OK)
+        
+        # Parse request data
+        data = request.data
+        
+        # Reject oversized batches before paying for validation
+        if _too_many_tasks(data.get('tasks') if isinstance(data, dict) else data):
+            return _too_many_tasks_response()
+        
+        # Handle both direct task list and wrapped format
+        if isinstance(data, list):
+            # Direct list of tasks: keep the valid ones and report
+            # the rest
+            strategy = request.query_params.get('strategy', 'smart_balance')
+            custom_weights = None
+            validated_tasks, task_errors = validate_task_list(data)
+            validation_errors = [
+                {
+                    'index': i,
+                    'task': data[i].get('title', f'Task {i}'),
+                    'errors': errors
+                }
+                for i, errors in task_errors
+            ]
+        else:
+            # Wrapped format with tasks key
+            serializer = AnalyzeRequestSerializer(data=data)
+            if not serializer.is_valid():
                 return Response(
                     {
-                        'error': 'All tasks failed validation',
-                        'details': validation_errors
+                        'error': 'Validation failed',
+                        'details': serializer.errors
                     },
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Analyze tasks
-            result = analyze_tasks(
-                tasks=validated_tasks,
-                strategy=strategy,
-                custom_weights=custom_weights
-            )
-            
-            # Add validation warnings if some tasks were skipped
-            if validation_errors:
-                result['warnings'].append(
-                    f"{len(validation_errors)} task(s) skipped due to validation errors"
-                )
-                result['validation_errors'] = validation_errors
-            
-            return Response(result, status=status.HTTP_200_OK)
-            
-        except json.JSONDecodeError:
+            # Every task was validated as part of the request, so
+            # there is nothing to re-validate or skip
+            validated_data = serializer.validated_data
+            validated_tasks = validated_data.get('tasks', [])
+            strategy = validated_data.get('strategy', 'smart_balance')
+            custom_weights = validated_data.get('weights')
+            validation_errors = []
+        
+        # If all tasks failed validation, return error
+        if validation_errors and not validated_tasks:
             return Response(
-                {'error': 'Invalid JSON in request body'},
+                {
+                    'error': 'All tasks failed validation',
+                    'details': validation_errors
+                },
                 status=status.HTTP_400_BAD_REQUEST
             )
-        except Exception as e:
-            return Response(
-                {'error': f'Internal error: {str(e)}'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        
+        # Analyze tasks
+        result = analyze_tasks(
+            tasks=validated_tasks,
+            strategy=strategy,
+            custom_weights=custom_weights
+        )
+        
+        # Add validation warnings if some tasks were skipped
+        if validation_errors:
+            result['warnings'].append(
+                f"{len(validation_errors)} task(s) skipped due to validation errors"
+            )
+            result['validation_errors'] = validation_errors
+        
+        submitted = data if isinstance(data, list) else data.get('tasks', [])
+        if cache_key is not None and _has_own_ids(submitted):
+            _cache_response(cache_key, result, len(validated_tasks))
+        
+        if len(result['tasks']) > STREAMING_THRESHOLD:
+            return StreamingHttpResponse(
+                _stream_json(result), content_type='application/json'
             )
+        return Response(result, status=status.HTTP_200_OK)
 
 
 class SuggestTasksView(APIView):
@@ -198,18 +357,14 @@ class SuggestTasksView(APIView):
                         }
                     ]
                 },
-                'available_strategies': [
-                    'smart_balance',
-                    'fastest_wins', 
-                    'high_impact',
-                    'deadline_driven'
-                ]
+                'available_strategies': [value for value, _ in STRATEGY_CHOICES]
             })
         
-        return self._get_suggestions(tasks, request)
+        return self._get_suggestions(tasks, request, _payload_digest(tasks_param.encode()))
     
     def post(self, request):
         """Handle POST request with tasks in body."""
+        digest = _body_digest(request)
         data = request.data
         
         # Handle both direct task list and wrapped format
@@ -218,20 +373,37 @@ class SuggestTasksView(APIView):
         else:
             tasks = data.get('tasks', [])
         
-        return self._get_suggestions(tasks, request)
+        return self._get_suggestions(tasks, request, digest)
     
-    def _get_suggestions(self, tasks, request):
-        """Common logic for getting suggestions."""
+    def _get_suggestions(self, tasks, request, digest=None):
+        """Common logic for getting suggestions (digest: see _payload_digest)."""
+        # Reject malformed or oversized payloads before validation
+        if not isinstance(tasks, list):
+            return Response(
+                {'error': 'Tasks must be a list'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if _too_many_tasks(tasks):
+            return _too_many_tasks_response()
+        
         try:
             count = int(request.query_params.get('count', 3))
+            if count < 1:
+                raise ValueError('count must be at least 1')
             strategy = request.query_params.get('strategy', 'smart_balance')
             
+            # Asking for more suggestions than there are tasks gives the same
+            # result, so clamp before count becomes part of the cache key
+            count = min(count, len(tasks))
+            cache_key = None
+            if digest is not None:
+                cache_key = ('suggest', digest, count, strategy, date.today())
+                cached = _cached_response(cache_key)
+                if cached is not None:
+                    return Response(cached, status=status.HTTP_200_OK)
+            
             # Validate tasks
-            validated_tasks = []
-            for task in tasks:
-                task_serializer = TaskInputSerializer(data=task)
-                if task_serializer.is_valid():
-                    validated_tasks.append(task_serializer.validated_data)
+            validated_tasks, _ = validate_task_list(tasks)
             
             if not validated_tasks:
                 return Response(
@@ -246,6 +418,9 @@ class SuggestTasksView(APIView):
                 strategy=strategy
             )
             
+            if cache_key is not None and _has_own_ids(tasks):
+                _cache_response(cache_key, result, len(validated_tasks))
+            
             return Response(result, status=status.HTTP_200_OK)
             
         except ValueError as e:
@@ -253,11 +428,6 @@ class SuggestTasksView(APIView):
                 {'error': f'Invalid parameter: {str(e)}'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        except Exception as e:
-            return Response(
-                {'error': f'Internal error: {str(e)}'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
 
 
 class StrategiesView(APIView):
@@ -268,34 +438,8 @@ class StrategiesView(APIView):
     """
     
     def get(self, request):
-        """Return available strategies."""
-        strategies = {
-            'smart_balance': {
-                'name': 'Smart Balance',
-                'description': 'Balanced approach considering urgency, importance, effort, and dependencies',
-                'weights': {'urgency': 0.35, 'importance': 0.30, 'effort': 0.20, 'dependency': 0.15}
-            },
-            'fastest_wins': {
-                'name': 'Fastest Wins',
-                'description': 'Prioritize quick, low-effort tasks to build momentum',
-                'weights': {'urgency': 0.15, 'importance': 0.15, 'effort': 0.55, 'dependency': 0.15}
-            },
-            'high_impact': {
-                'name': 'High Impact',
-                'description': 'Focus on the most important tasks first',
-                'weights': {'urgency': 0.20, 'importance': 0.55, 'effort': 0.10, 'dependency': 0.15}
-            },
-            'deadline_driven': {
-                'name': 'Deadline Driven',
-                'description': 'Prioritize based on approaching deadlines',
-                'weights': {'urgency': 0.55, 'importance': 0.20, 'effort': 0.10, 'dependency': 0.15}
-            }
-        }
-        
-        return Response({
-            'strategies': strategies,
-            'default': 'smart_balance'
-        })
+        """Return available strategies (rendered once at import)."""
+        return HttpResponse(_STRATEGIES_JSON, content_type='application/json')
 
 
 class FeedbackView(APIView):